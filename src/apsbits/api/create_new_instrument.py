@@ -9,39 +9,37 @@ __version__ = "1.0.0"
 
 import argparse
 import os
-import re
 import shutil
 import sys
 from pathlib import Path
 
+from apsbits.api.delete_instrument import validate_instrument_name
+
+# Template locations inside the installed apsbits package.
+_PKG_ROOT: Path = Path(__file__).resolve().parent.parent
+_DEMO_SCRIPTS: Path = _PKG_ROOT / "demo_scripts"
+_DEMO_TEMPLATE: Path = _PKG_ROOT / "demo_instrument"
+
 
 def create_qserver_script(scripts_dir: Path, name: str) -> None:
     """
     Create a qserver script file in the scripts directory.
     """
 
-    demo_scripts_path: Path = (
-        Path(__file__).resolve().parent.parent / "demo_scripts"
-    ).resolve()
-
-    for scripts_file in demo_scripts_path.glob("*"):
-        shutil.copy2(scripts_file, scripts_dir)
+    with os.scandir(_DEMO_SCRIPTS) as entries:
+        for entry in entries:
+            if entry.is_file():
+                shutil.copy2(entry.path, scripts_dir)
 
     # Rename qs_host.sh to include the instrument name
     os.rename(scripts_dir / "qs_host.sh", scripts_dir / f"{name}_qs_host.sh")
 
     new_script_path = scripts_dir / f"{name}_qs_host.sh"
 
-    # Read script contents
-    with open(new_script_path, "r") as src:
-        script_contents = src.read()
-
     # Replace demo package name with new instrument name
-    updated_contents = script_contents.replace("demo_instrument", name)
-
-    # Write updated script
-    with open(new_script_path, "w") as dest:
-        dest.write(updated_contents)
+    new_script_path.write_text(
+        new_script_path.read_text().replace("demo_instrument", name)
+    )
 
     # Make script executable
     os.chmod(new_script_path, new_script_path.stat().st_mode | 0o755)
@@ -56,11 +54,12 @@ def copy_instrument(destination_dir: Path) -> None:
     :return: None
     """
 
-    demo_template_path: Path = (
-        Path(__file__).resolve().parent.parent / "demo_instrument"
-    ).resolve()
-
-    shutil.copytree(str(demo_template_path), str(destination_dir))
+    # Compiled bytecode belongs to the template, not to the new instrument.
+    shutil.copytree(
+        str(_DEMO_TEMPLATE),
+        str(destination_dir),
+        ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+    )
 
 
 def edit_qserver_folder(qserver_dir: Path, name: str) -> None:
@@ -96,11 +95,11 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if re.fullmatch(r"[a-z][_a-z0-9]*", args.name) is None:
+    if not validate_instrument_name(args.name):
         print(f"Error: Invalid instrument name '{args.name}'.", file=sys.stderr)
         sys.exit(1)
 
-    main_path: Path = Path(os.getcwd()).resolve()
+    main_path: Path = Path(os.getcwd())
 
     new_instrument_dir: Path = main_path / "src" / args.name
 
@@ -117,13 +116,13 @@ def main() -> None:
         print("Error: Destination scripts directory does not exist.", file=sys.stderr)
         sys.exit(1)
 
-    if new_instrument_dir.exists():
-        print(f"Error: Destination '{new_instrument_dir}' exists.", file=sys.stderr)
-        sys.exit(1)
-
     try:
+        # copytree() refuses an existing destination, no need to check first.
         copy_instrument(new_instrument_dir)
         print(f"Template copied to '{new_instrument_dir}'.")
+    except FileExistsError:
+        print(f"Error: Destination '{new_instrument_dir}' exists.", file=sys.stderr)
+        sys.exit(1)
     except Exception as exc:
         print(f"Error copying instrument: {exc}", file=sys.stderr)
         sys.exit(1)
@@ -9,7 +9,6 @@ configuration directory to a .deleted directory in the workspace.
 __version__ = "1.0.0"
 
 import argparse
-import os
 import re
 import shutil
 import sys
@@ -18,6 +17,8 @@ from pathlib import Path
 
 # No typing imports needed - using built-in types
 
+_NAME_RE = re.compile(r"[a-z][_a-z0-9]*")
+
 
 def validate_instrument_name(name: str) -> bool:
     """
@@ -26,7 +27,7 @@ def validate_instrument_name(name: str) -> bool:
     :param name: The instrument name to validate.
     :return: True if the name is valid, False otherwise.
     """
-    return re.fullmatch(r"[a-z][_a-z0-9]*", name) is not None
+    return _NAME_RE.fullmatch(name) is not None
 
 
 def get_instrument_paths(name: str) -> tuple[Path, Path]:
@@ -37,7 +38,7 @@ def get_instrument_paths(name: str) -> tuple[Path, Path]:
     :return: A tuple containing the instrument directory path and qserver directory
              path.
     """
-    main_path: Path = Path(os.getcwd()).resolve()
+    main_path: Path = Path.cwd()
     instrument_dir: Path = main_path / "src" / name
     qserver_script_dir: Path = main_path / "scripts" / f"{name}_qs_host.sh"
 
@@ -52,7 +53,7 @@ def delete_instrument(instrument_dir: Path, qserver_script_dir: Path) -> None:
     :param qserver_script_dir: Path to the qserver script.
     :return: None
     """
-    main_path: Path = Path(os.getcwd()).resolve()
+    main_path: Path = Path.cwd()
     deleted_dir: Path = main_path / ".deleted"
 
     # Create .deleted directory if it doesn't exist
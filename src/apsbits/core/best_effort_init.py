@@ -36,18 +36,19 @@ def init_bec_peaks(
 
     bec_config = iconfig.get("BEC", {})
 
-    if not bec_config.get("BASELINE", True):
-        bec.disable_baseline()
-
-    if not bec_config.get("HEADING", True):
-        bec.disable_heading()
-
+    disablers = (
+        ("BASELINE", bec.disable_baseline),
+        ("HEADING", bec.disable_heading),
+        ("TABLE", bec.disable_table),
+    )
+    for key, disable in disablers:
+        if not bec_config.get(key, True):
+            disable()
+
+    # No plots in the queueserver, regardless of configuration.
     if not bec_config.get("PLOTS", True) or running_in_queueserver():
         bec.disable_plots()
 
-    if not bec_config.get("TABLE", True):
-        bec.disable_table()
-
     peaks = bec.peaks
     """Dictionary with statistical analysis of LivePlots."""
 
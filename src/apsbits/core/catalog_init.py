@@ -8,17 +8,18 @@ Databroker catalog
 
 import logging
 import weakref
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Union
 
-import databroker
-from bluesky_tiled_plugins.clients.catalog_of_bluesky_runs import CatalogOfBlueskyRuns
-from databroker._drivers.mongo_normalized import BlueskyMongoCatalog
-from databroker._drivers.msgpack import BlueskyMsgpackCatalog
-from tiled.client import from_profile
-from tiled.client import from_uri
-from tiled.client.container import Container
-from tiled.server import SimpleTiledServer
+if TYPE_CHECKING:
+    # databroker & tiled are slow to import.  Each handler imports what it uses.
+    from bluesky_tiled_plugins.clients.catalog_of_bluesky_runs import (
+        CatalogOfBlueskyRuns,
+    )
+    from databroker._drivers.mongo_normalized import BlueskyMongoCatalog
+    from databroker._drivers.msgpack import BlueskyMsgpackCatalog
+    from tiled.client.container import Container
 
 logger = logging.getLogger(__name__)
 logger.bsdev(__file__)
@@ -26,8 +27,8 @@ logger.bsdev(__file__)
 # The httpx (via tiled) logger is set too noisy.  Make it quieter.
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
-DATABROKER_CATALOG_TYPE = Union[BlueskyMongoCatalog, BlueskyMsgpackCatalog]
-TILED_CATALOG_TYPE = Union[CatalogOfBlueskyRuns, Container]
+DATABROKER_CATALOG_TYPE = Union["BlueskyMongoCatalog", "BlueskyMsgpackCatalog"]
+TILED_CATALOG_TYPE = Union["CatalogOfBlueskyRuns", "Container"]
 ANY_CATALOG_TYPE = Union[DATABROKER_CATALOG_TYPE, TILED_CATALOG_TYPE]
 
 
@@ -73,18 +74,24 @@ def _databroker_named_catalog(
     None,
 ]:
     """Connect with a named databroker catalog."""
-    cat = None
     catalog_name = iconfig.get("DATABROKER_CATALOG")
-    if catalog_name is not None:
-        cat = databroker.catalog[catalog_name].v2
+    if catalog_name is None:
+        return None  # No need to import databroker.
+
+    import databroker
+
+    cat = databroker.catalog[catalog_name].v2
     logger.debug("%s: cat=%s", type(cat).__name__, str(cat))
-    if cat is not None:
-        logger.info("Databroker catalog initialized: %s", cat.name)
+    logger.info("Databroker catalog initialized: %s", cat.name)
     return cat
 
 
-def _databroker_temporary_catalog(iconfig: dict[str, Any]) -> BlueskyMsgpackCatalog:
+def _databroker_temporary_catalog(
+    iconfig: dict[str, Any],
+) -> "BlueskyMsgpackCatalog":
     """Connect with a temporary databroker catalog."""
+    import databroker
+
     cat = databroker.temp().v2
     logger.debug("%s: cat=%s", type(cat).__name__, str(cat))
     logger.info("Databroker temporary catalog initialized")
@@ -93,31 +100,36 @@ def _databroker_temporary_catalog(iconfig: dict[str, Any]) -> BlueskyMsgpackCata
 
 def _tiled_profile_client(iconfig: dict[str, Any]) -> Union[None, TILED_CATALOG_TYPE]:
     """Connect with a tiled server using a profile."""
-    cat = None
     profile = iconfig.get("TILED_PROFILE_NAME")
+    if profile is None:
+        return None  # No need to import tiled.
+
+    from tiled.client import from_profile
+
     path = iconfig.get("TILED_PATH_NAME")
-    if profile is not None:
-        client = from_profile(profile)
-        cat = client if path is None else client[path]
+    client = from_profile(profile)
+    cat = client if path is None else client[path]
 
     logger.debug("%s: cat=%s", type(cat).__name__, str(cat))
-    if cat is not None:
-        logger.info(
-            "Tiled server (catalog) connected, profile=%r, path=%r",
-            profile,
-            path,
-        )
+    logger.info(
+        "Tiled server (catalog) connected, profile=%r, path=%r",
+        profile,
+        path,
+    )
 
     return cat
 
 
-def _tiled_temporary_catalog(iconfig: dict[str, Any]) -> Container:
+def _tiled_temporary_catalog(iconfig: dict[str, Any]) -> "Container":
     """Connect with a temporary tiled catalog.
 
     WARNING: The SimpleTiledServer creates background threads that may prevent
     clean process exit. For interactive use, explicitly delete the returned
     client when done: `del client`
     """
+    from tiled.client import from_uri
+    from tiled.server import SimpleTiledServer
+
     save_path = iconfig.get("TILED_SAVE_PATH")  # testing only?
     server = SimpleTiledServer(save_path)
 
@@ -12,18 +12,27 @@ Construct ophyd-style devices from simple specifications in YAML files.
 """
 
 import asyncio
+import atexit
+import copy
 import functools
+import itertools
 import logging
+import os
 import pathlib
 import sys
 import time
 from typing import Callable
 
 import guarneri
-from ophyd_async.core import NotConnected
+import yaml
 
 from apsbits.utils.config_loaders import get_config
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlSafeLoader
+
 logger = logging.getLogger(__name__)
 logger.bsdev(__file__)
 
@@ -31,6 +40,72 @@ MAIN_NAMESPACE = "__main__"
 
 _instrument = None
 oregistry = None
+_loop = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop for the device loader, reused across make_devices() calls.
+
+    The loop only runs during make_devices(); it is closed at exit.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+@atexit.register
+def _close_loop() -> None:
+    """Close the device loader's event loop."""
+    if _loop is not None and not _loop.is_closed():
+        _loop.close()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> list[tuple]:
+    """
+    Parse a YAML device file into (creator, kwargs) pairs, one per device.
+
+    The file's modification time and size are part of the cache key, so
+    an edited file is parsed again.  Callers must not modify the result.
+    """
+    # libyaml decodes the whole payload in C, in one pass.
+    config_data = yaml.load(pathlib.Path(path).read_bytes(), Loader=YamlSafeLoader)
+
+    if not isinstance(config_data, dict):
+        raise ValueError(f"Invalid device file format in {path}")
+
+    # One flat pass, pairs built in C: no intermediate list per creator.
+    return list(
+        itertools.chain.from_iterable(
+            zip(itertools.repeat(creator), specs)
+            for creator, specs in config_data.items()
+        )
+    )
+
+
+class Instrument(guarneri.Instrument):
+    """guarneri Instrument that parses each YAML device file only once."""
+
+    def parse_yaml_file(self, config_file) -> list[dict]:
+        """Device definitions from a YAML file, cached by file revision."""
+        try:
+            path = os.path.abspath(config_file.name)
+            st = os.fstat(config_file.fileno())
+        except (AttributeError, OSError, TypeError, ValueError):
+            # Not backed by a file on disk (such as io.StringIO).
+            return super().parse_yaml_file(config_file)
+
+        devices = _load_yaml_cached(path, st.st_mtime_ns, st.st_size)
+        return [
+            {
+                "device_class": creator,
+                "args": (),  # ALL specs are kwargs!
+                "kwargs": copy.deepcopy(table),  # guarneri may modify the kwargs.
+            }
+            for creator, table in devices
+        ]
 
 
 def make_devices(
@@ -54,7 +129,7 @@ def make_devices(
     PARAMETERS
 
     pause : float
-        Wait 'pause' seconds (default: 1) for slow objects to connect.
+        Wait up to 'pause' seconds (default: 1) for slow objects to connect.
     clear : bool
         Clear 'oregistry' first if True (the default).
     file : str | pathlib.Path | None
@@ -77,23 +152,30 @@ def make_devices(
         instrument_path = pathlib.Path(instrument_path_config).parent
         configs_path = instrument_path / "configs"
         logger.info(
-            f"No custom path provided.\n\nUsing default configs path: {configs_path}"
+            "No custom path provided.\n\nUsing default configs path: %s",
+            configs_path,
         )
 
     else:
-        logger.info(f"Using custom path for device files: {path}")
+        logger.info("Using custom path for device files: %s", path)
         configs_path = pathlib.Path(path)
 
     if clear and isinstance(device_manager, guarneri.Instrument):
-        main_namespace = sys.modules[MAIN_NAMESPACE]
+        main_ns_dict = sys.modules[MAIN_NAMESPACE].__dict__
 
         # Clear the oregistry and remove any devices registered previously.
+        removed = []
         for dev_name in device_manager.devices.device_names:
             # Remove from __main__ namespace any devices registered previously.
-            if hasattr(main_namespace, dev_name):
-                logger.info("Removing %r from %r", dev_name, MAIN_NAMESPACE)
-
-                delattr(main_namespace, dev_name)
+            if main_ns_dict.pop(dev_name, None) is not None:
+                removed.append(dev_name)
+        if removed and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Removed %d devices from %r: %s",
+                len(removed),
+                MAIN_NAMESPACE,
+                sorted(removed),
+            )
 
         device_manager.devices.clear()
 
@@ -101,39 +183,49 @@ def make_devices(
 
     # Load each device file
     device_path = configs_path / file
-    if not device_path.exists():
-        logger.error("Device file not found: %s", device_path)
-
-    else:
-        logger.info("Loading device file: %s", device_path)
-        if isinstance(device_manager, guarneri.Instrument):
-            try:
-                asyncio.run(
-                    guarneri_namespace_loader(
-                        yaml_device_file=device_path,
-                        instrument=device_manager,
-                        oregistry=device_manager.devices,
-                        main=True,
-                    )
+    logger.info("Loading device file: %s", device_path)
+    if isinstance(device_manager, guarneri.Instrument):
+        try:
+            _get_loop().run_until_complete(
+                guarneri_namespace_loader(
+                    yaml_device_file=device_path,
+                    instrument=device_manager,
+                    oregistry=device_manager.devices,
+                    main=True,
+                    pause=pause,
                 )
-            except Exception as e:
-                logger.error("Error loading device file %s: %s", device_path, str(e))
-                logger.error("Full exception:", exc_info=True)
-        elif device_manager == "happi":
-            pass
-        elif device_manager is None:
-            logger.error("No device_manager provided.")
-            return
-    if pause > 0:
-        logger.debug(
-            "Waiting %s seconds for slow objects to connect.",
-            pause,
-        )
-        time.sleep(pause)
+            )
+        except Exception as e:
+            # Opening the file is the existence check.  Any other missing
+            # file (one a device needs, say) is a load error like the rest.
+            if isinstance(e, FileNotFoundError) and e.filename is not None:
+                if os.fspath(e.filename) == os.fspath(device_path):
+                    logger.error("Device file not found: %s", device_path)
+                    return
+            logger.error("Error loading device file %s: %s", device_path, str(e))
+            logger.error("Full exception:", exc_info=True)
+    elif device_manager == "happi":
+        pass
+    elif device_manager is None:
+        logger.error("No device_manager provided.")
+        return
+
+
+async def _wait_for_connections(devices, timeout: float) -> bool:
+    """Wait up to 'timeout' seconds for all 'devices' to report connected."""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while not all(getattr(dev, "connected", True) for dev in devices):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(2 * delay, 0.25)
+    return True
 
 
 async def guarneri_namespace_loader(
-    yaml_device_file, instrument=None, oregistry=None, main=True
+    yaml_device_file, instrument=None, oregistry=None, main=True, pause=0
 ):
     """
     Load our ophyd-style controls as described in a YAML file into the main namespace.
@@ -144,27 +236,39 @@ async def guarneri_namespace_loader(
         YAML file describing ophyd-style controls to be created.
     main : bool
         If ``True`` add these devices to the ``__main__`` namespace.
+    pause : float
+        Wait up to 'pause' seconds (default: 0) for slow objects to connect.
 
     """
-    logger.debug("Devices file %r.", str(yaml_device_file))
+    logger.debug("Devices file '%s'.", yaml_device_file)
     t0 = time.time()
 
-    current_devices = oregistry.device_names
+    current_devices = frozenset(oregistry.device_names)
     instrument.load(yaml_device_file)
 
-    try:
-        await instrument.connect()
-    except NotConnected as exc:
-        logger.exception(exc)
+    # Connects the new devices concurrently.  One failure must not stop the rest.
+    _, failures = await instrument.connect(return_exceptions=True)
+    for name, exc in failures.items():
+        logger.error("Device %r not connected: %s", name, exc)
+
+    if pause > 0:
+        logger.debug("Waiting up to %s seconds for slow objects to connect.", pause)
+        if not await _wait_for_connections(oregistry.root_devices, pause):
+            logger.warning("Some devices not connected after %s seconds.", pause)
 
     logger.info("Devices loaded in %.3f s.", time.time() - t0)
     if main:
-        main_namespace = sys.modules[MAIN_NAMESPACE]
-        for label in sorted(oregistry.device_names):
-            if label in current_devices:
-                continue
-            logger.info("Adding ophyd device %r to main namespace", label)
-            setattr(main_namespace, label, oregistry[label])
+        # One pass over the registry; no find() per device name.
+        new_devices = {
+            device.name: device
+            for device in oregistry.root_devices
+            if device.name not in current_devices
+        }
+        if logger.isEnabledFor(logging.INFO):
+            for label in sorted(new_devices):  # Report new devices alphabetically.
+                logger.info("Adding ophyd device %r to main namespace", label)
+        main_ns_dict = sys.modules[MAIN_NAMESPACE].__dict__
+        main_ns_dict.update(new_devices)
 
 
 def init_instrument(device_manager):
@@ -172,7 +276,7 @@ def init_instrument(device_manager):
     if device_manager == "guarneri" or None:
         global _instrument
         global oregistry
-        _instrument = guarneri.Instrument({})
+        _instrument = Instrument({})
         oregistry = _instrument.devices
         return _instrument, oregistry
     elif device_manager == "happi":
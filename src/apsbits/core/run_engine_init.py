@@ -80,12 +80,13 @@ def init_RE(
         additional configurations such as control layer, timeouts, and progress bar
         integration are applied.
     """
-    re_config = iconfig.get("RUN_ENGINE", {})
+    re_config = iconfig.get("RUN_ENGINE") or {}
+    ophyd_config = iconfig.get("OPHYD") or {}
 
     # Steps that must occur before any EpicsSignalBase (or subclass) is created.
-    control_layer = iconfig.get("OPHYD", {}).get("CONTROL_LAYER", "PyEpics")
+    control_layer = ophyd_config.get("CONTROL_LAYER", "PyEpics")
     set_control_layer(control_layer=control_layer)
-    set_timeouts(timeouts=iconfig.get("OPHYD", {}).get("TIMEOUTS", {}))
+    set_timeouts(timeouts=ophyd_config.get("TIMEOUTS", {}))
 
     RE = bluesky.RunEngine(**kwargs)
     """The Bluesky RunEngine object."""
@@ -167,7 +168,7 @@ def init_RE(
                     )
                     raise
 
-    scan_id_pv = iconfig.get("RUN_ENGINE", {}).get("SCAN_ID_PV")
+    scan_id_pv = re_config.get("SCAN_ID_PV")
     connect_scan_id_pv(RE, pv=scan_id_pv)
 
     if re_config.get("USE_PROGRESS_BAR", True):
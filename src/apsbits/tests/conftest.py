@@ -9,16 +9,20 @@ Fixtures:
     runengine_with_devices: A RunEngine object in a session with devices configured.
 """
 
-import time
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from apsbits.core.instrument_init import init_instrument
 from apsbits.demo_instrument.startup import RE
 from apsbits.demo_instrument.startup import make_devices
 from apsbits.utils.config_loaders import load_config
 
+_ICONFIG_PATH = (
+    Path(__file__).parent.parent / "demo_instrument" / "configs" / "iconfig.yml"
+)
+
 
 @pytest.fixture(scope="session")
 def runengine_with_devices() -> Any:
@@ -32,13 +36,9 @@ def runengine_with_devices() -> Any:
         Any: An instance of the RunEngine with devices configured.
     """
     # Load the configuration before testing
-    instrument_path = Path(__file__).parent.parent / "demo_instrument"
-    iconfig_path = instrument_path / "configs" / "iconfig.yml"
-    load_config(iconfig_path)
+    load_config(_ICONFIG_PATH)
 
     # Initialize instrument and make devices
-    from apsbits.core.instrument_init import init_instrument
-
     instrument, oregistry = init_instrument("guarneri")
     make_devices(file="devices.yml", device_manager=instrument)
 
@@ -91,12 +91,10 @@ def ioc():
 
         # Wait briefly for the process to initialize. If it exits early,
         # collect stdout/stderr and raise.
-        timeout = 5.0
-        poll = 0.0
-        interval = 0.05
-        while poll < timeout and proc.poll() is None:
-            time.sleep(interval)
-            poll += interval
+        try:
+            proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            pass  # Still running, as expected.
 
         if proc.poll() is not None:
             out, err = proc.communicate(timeout=1)
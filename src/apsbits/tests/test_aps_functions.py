@@ -0,0 +1,83 @@
+"""
+Test the APS utility helper functions.
+"""
+
+import os
+import pathlib
+
+import pytest
+
+from apsbits.utils.aps_functions import aps_dm_setup
+
+
+def test_aps_dm_setup(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that exported variables of a DM setup script reach the environment.
+    """
+    monkeypatch.delenv("DM_STATION_NAME", raising=False)
+    monkeypatch.delenv("DM_TEST_URL", raising=False)
+    bash_script = tmp_path / "dm.setup.sh"
+    bash_script.write_text(
+        "#!/bin/bash\n"
+        "export DM_STATION_NAME=TEST_DM\n"
+        "export DM_TEST_URL=https://localhost:2222\n"
+        "echo not an export\n"
+    )
+
+    aps_dm_setup(bash_script)
+
+    assert os.environ["DM_STATION_NAME"] == "TEST_DM"
+    assert os.environ["DM_TEST_URL"] == "https://localhost:2222"
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ('export DM_TEST_VALUE="x y"', "x y"),
+        ("export DM_TEST_VALUE='x y'", "x y"),
+        ("export DM_TEST_VALUE=2 # comment", "2"),
+        ("    export DM_TEST_VALUE=indented", "indented"),
+    ],
+    ids=["double-quoted", "single-quoted", "comment", "indented"],
+)
+def test_aps_dm_setup_bash_syntax(
+    line: str, expected: str, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that export values are read as bash would read them.
+    """
+    monkeypatch.delenv("DM_TEST_VALUE", raising=False)
+    bash_script = tmp_path / "dm.setup.sh"
+    bash_script.write_text(f"if true; then\n{line}\nfi\n")
+
+    aps_dm_setup(bash_script)
+
+    assert os.environ["DM_TEST_VALUE"] == expected
+
+
+def test_aps_dm_setup_edited_file(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that an edited DM setup script is read again, even if its mtime is not.
+    """
+    monkeypatch.delenv("DM_TEST_VALUE", raising=False)
+    bash_script = tmp_path / "dm.setup.sh"
+    bash_script.write_text("export DM_TEST_VALUE=1\n")
+    st = bash_script.stat()
+    aps_dm_setup(bash_script)
+    assert os.environ["DM_TEST_VALUE"] == "1"
+
+    bash_script.write_text("export DM_TEST_VALUE=22\n")
+    os.utime(bash_script, ns=(st.st_atime_ns, st.st_mtime_ns))  # same mtime
+    aps_dm_setup(bash_script)
+    assert os.environ["DM_TEST_VALUE"] == "22"
+
+
+def test_aps_dm_setup_missing_file(tmp_path: pathlib.Path) -> None:
+    """
+    Test that a missing DM setup script leaves the environment unchanged.
+    """
+    before = dict(os.environ)
+    aps_dm_setup(tmp_path / "no-such-file.sh")
+    assert dict(os.environ) == before
@@ -10,7 +10,10 @@ import pytest
 import tomli_w
 import yaml
 
+from apsbits.utils.config_loaders import get_config
 from apsbits.utils.config_loaders import load_config
+from apsbits.utils.config_loaders import update_config
+from apsbits.utils.config_loaders import validate_instrument_path
 
 if TYPE_CHECKING:
     pass
@@ -78,6 +81,43 @@ def test_load_toml_config(toml_config_file: pathlib.Path) -> None:
     assert config["test_key"] == "test_value"
 
 
+def test_load_config_sees_edits(yml_config_file: pathlib.Path) -> None:
+    """
+    Test that an edited configuration file is parsed again.
+
+    Args:
+        yml_config_file: Path to the temporary YAML configuration file.
+    """
+    config = load_config(yml_config_file)
+    assert config["test_key"] == "test_value"
+
+    config["test_key"] = "changed in memory"
+    config = load_config(yml_config_file)
+    assert config["test_key"] == "test_value"
+
+    yml_config_file.write_text(yaml.dump({"test_key": "edited on disk"}))
+    config = load_config(yml_config_file)
+    assert config["test_key"] == "edited on disk"
+
+
+def test_get_config_updated(
+    yml_config_file: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that get_config() reflects update_config().
+
+    Args:
+        yml_config_file: Path to the temporary YAML configuration file.
+        monkeypatch: Restores the global configuration afterwards.
+    """
+    load_config(yml_config_file)
+    iconfig = get_config()
+    monkeypatch.setitem(iconfig, "test_key", iconfig["test_key"])
+
+    update_config({"test_key": "updated"})
+    assert get_config()["test_key"] == "updated"
+
+
 def test_load_config_none_path() -> None:
     """Test loading configuration with None path."""
     with pytest.raises(ValueError, match="config_path must be provided"):
@@ -113,3 +153,43 @@ def test_load_config_invalid_content() -> None:
             load_config(path)
     finally:
         path.unlink()
+
+
+def test_validate_instrument_path(tmp_path: pathlib.Path) -> None:
+    """Test validating an instrument path, including nested expected names."""
+    (tmp_path / "configs").mkdir()
+    (tmp_path / "configs" / "iconfig.yml").touch()
+    (tmp_path / "src" / "plans").mkdir(parents=True)
+
+    valid, message = validate_instrument_path(
+        tmp_path,
+        expected_files=["configs/iconfig.yml"],
+        expected_dirs=["src", "src/plans"],
+    )
+    assert valid, message
+
+    valid, message = validate_instrument_path(
+        tmp_path, expected_files=["configs/missing.yml"], expected_dirs=[]
+    )
+    assert not valid
+    assert "configs/missing.yml" in message
+
+    valid, message = validate_instrument_path(
+        tmp_path, expected_files=[], expected_dirs=["configs/iconfig.yml"]
+    )
+    assert not valid
+    assert "configs/iconfig.yml" in message
+
+
+def test_validate_instrument_path_unreadable(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an unreadable instrument path is reported, not raised."""
+
+    def scandir(path):
+        raise PermissionError(13, "Permission denied", str(path))
+
+    monkeypatch.setattr("apsbits.utils.config_loaders.os.scandir", scandir)
+    valid, message = validate_instrument_path(tmp_path)
+    assert not valid
+    assert "Permission denied" in message
@@ -16,6 +16,7 @@ from apsbits.utils.sim_creator import predefined_device
         ["ophyd.sim.noisy_det", None, "SynGauss"],
         ["ophyd.sim.noisy_det", "sim_det", "SynGauss"],
     ],
+    ids=["motor-default", "motor-named", "det-default", "det-named"],
 )
 def test_predefined(creator: str, name: str | None, klass: str) -> None:
     """Import predefined devices."""
@@ -32,6 +33,7 @@ def test_predefined(creator: str, name: str | None, klass: str) -> None:
         {"prefix": "ioc:m", "first": 1, "last": 4, "labels": ["motor"]},
         {"prefix": "ioc:m", "names": "m", "first": 7, "last": 22, "labels": ["motor"]},
     ],
+    ids=["m1-m4", "m7-m22"],
 )
 def test_motors(kwargs: dict[str, Any]) -> None:
     """Create a block of motors."""
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 from apsbits.demo_instrument.plans.sim_plans import sim_count_plan
 from apsbits.demo_instrument.plans.sim_plans import sim_print_plan
 from apsbits.demo_instrument.plans.sim_plans import sim_rel_scan_plan
+from apsbits.demo_instrument.startup import RE
 from apsbits.demo_instrument.startup import bec
 from apsbits.demo_instrument.startup import cat
 from apsbits.demo_instrument.startup import peaks
@@ -23,6 +24,8 @@ from apsbits.demo_instrument.startup import sd
 from apsbits.demo_instrument.startup import specwriter
 from apsbits.utils.config_loaders import get_config
 from apsbits.utils.helper_functions import running_in_queueserver
+from apsbits.utils.metadata import get_md_path
+from apsbits.utils.metadata import re_metadata
 
 
 def test_startup(runengine_with_devices: object) -> None:
@@ -47,6 +50,13 @@ def test_startup(runengine_with_devices: object) -> None:
     assert not running_in_queueserver()
 
 
+def test_supplemental_data_preprocessor() -> None:
+    """
+    The SupplementalData preprocessor is installed exactly once.
+    """
+    assert RE.preprocessors.count(sd) == 1
+
+
 @pytest.mark.parametrize(
     "plan, n_uids",
     [
@@ -103,3 +113,17 @@ def test_iconfig() -> None:
 
     xmode = iconfig.get("XMODE_DEBUG_LEVEL")
     assert xmode is not None
+
+
+@pytest.mark.parametrize(
+    "iconfig",
+    [{}, {"RUN_ENGINE": None}, {"RUN_ENGINE": {"DEFAULT_METADATA": None}}],
+    ids=["absent", "empty", "empty-metadata"],
+)
+def test_metadata_empty_sections(iconfig: dict) -> None:
+    """
+    Empty (None) iconfig sections are treated like absent ones.
+    """
+    assert get_md_path(iconfig) is not None
+    md = re_metadata(iconfig)
+    assert md["iconfig"] == iconfig
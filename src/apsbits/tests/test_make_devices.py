@@ -5,10 +5,13 @@ Test to check if the make_devices function works as expected.
 import logging
 from typing import TYPE_CHECKING
 
+from apsbits.core.instrument_init import _load_yaml_cached
 from apsbits.core.instrument_init import init_instrument
 from apsbits.demo_instrument.startup import make_devices
 
 if TYPE_CHECKING:
+    import pathlib
+
     from _pytest.logging import LogCaptureFixture
 
 
@@ -30,3 +33,33 @@ def test_make_devices_file_name(caplog: "LogCaptureFixture[str]") -> None:
     for device in expected_devices:
         expected_message = f"Adding ophyd device '{device}' to main namespace"
         assert any(expected_message in record.message for record in caplog.records)
+
+
+def test_device_file_parsed_once() -> None:
+    """
+    Repeated loads of an unchanged device file reuse the cached parse.
+    """
+    instrument, oregistry = init_instrument("guarneri")
+    _load_yaml_cached.cache_clear()
+
+    make_devices(file="devices.yml", device_manager=instrument, pause=0)
+    make_devices(file="devices.yml", device_manager=instrument, pause=0)
+
+    info = _load_yaml_cached.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_make_devices_missing_file(
+    tmp_path: "pathlib.Path", caplog: "LogCaptureFixture[str]"
+) -> None:
+    """
+    A missing device file is reported as such.
+    """
+    caplog.set_level(logging.INFO)
+    instrument, oregistry = init_instrument("guarneri")
+
+    make_devices(file="missing.yml", path=tmp_path, device_manager=instrument)
+
+    expected_message = f"Device file not found: {tmp_path / 'missing.yml'}"
+    assert any(expected_message in record.message for record in caplog.records)
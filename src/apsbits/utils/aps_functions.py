@@ -3,14 +3,84 @@ APS utility helper functions
 ============================
 
 .. autosummary::
+    ~aps_dm_setup
     ~host_on_aps_subnet
 """
 
+import functools
+import logging
+import os
+import pathlib
+import re
+import shlex
 import socket
 
+logger = logging.getLogger(__name__)
 
+# ``export NAME=value ...`` lines (maybe indented) in the DM setup (bash) script.
+_EXPORT_RE = re.compile(r"^[ \t]*export[ \t]+(.+)$", re.MULTILINE)
+
+# Parsed DM setup scripts: {path: ((st_mtime_ns, st_size), environment)}
+_DM_CACHE: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
+def aps_dm_setup(dm_setup_file_path):
+    """
+    APS Data Management setup.
+
+    Read the bash script provided by APS DM for this account and add
+    its exported environment variables to this session.  Call once per
+    session, before any other DM code.
+
+    PARAMETERS
+
+    dm_setup_file_path : str | pathlib.Path | None
+        Full path to the DM setup (bash) script.  Nothing is done if None.
+    """
+    if dm_setup_file_path is None:
+        return
+
+    bash_script = pathlib.Path(dm_setup_file_path)
+    try:
+        st = bash_script.stat()
+    except FileNotFoundError:
+        logger.warning("APS DM setup file does not exist: '%s'", bash_script)
+        return
+
+    logger.info("APS DM environment file: %s", bash_script)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _DM_CACHE.get(str(bash_script))
+    if cached is not None and cached[0] == stamp:
+        environment = cached[1]  # Unchanged since last parsed.
+    else:
+        environment = _parse_exports(bash_script.read_text())
+        _DM_CACHE[str(bash_script)] = (stamp, environment)
+    os.environ.update(environment)
+
+    workflow_owner = os.environ.get("DM_STATION_NAME", "").lower()
+    logger.info("APS DM workflow owner: %s", workflow_owner)
+
+
+def _parse_exports(script: str) -> dict[str, str]:
+    """Variables exported by a bash script, with quotes and comments removed."""
+    environment = {}
+    # One pass of the regex over the whole script, not a match per line.
+    for m in _EXPORT_RE.finditer(script):
+        try:
+            words = shlex.split(m.group(1), comments=True)
+        except ValueError as exc:  # unbalanced quotes
+            logger.warning("Cannot parse %r: %s", m.group(0).strip(), exc)
+            continue
+        for word in words:
+            name, sep, value = word.partition("=")
+            if sep and name.isidentifier():
+                environment[name] = value
+    return environment
+
+
+@functools.lru_cache(maxsize=1)
 def host_on_aps_subnet():
-    """Detect if this host is on an APS subnet."""
+    """Detect if this host is on an APS subnet.  (Checked once per process.)"""
     LOOPBACK_IP4 = "127.0.0.1"
     PUBLIC_IP4_PREFIX = "164.54."
     PRIVATE_IP4_PREFIX = "10.54."
@@ -22,7 +92,4 @@ def host_on_aps_subnet():
             ip4 = sock.getsockname()[0]
         except Exception:
             ip4 = LOOPBACK_IP4
-    return True in [
-        ip4.startswith(PUBLIC_IP4_PREFIX),
-        ip4.startswith(PRIVATE_IP4_PREFIX),
-    ]
+    return ip4.startswith((PUBLIC_IP4_PREFIX, PRIVATE_IP4_PREFIX))
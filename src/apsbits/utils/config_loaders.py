@@ -6,20 +6,32 @@ It loads and validates the configuration from the iconfig.yml file and provides
 access to the configuration throughout the application.
 """
 
+import copy
 import logging
+import os
 import pathlib
+import tomllib
 from pathlib import Path
 from typing import Any
 from typing import Optional
 
-import tomli  # type: ignore
 import yaml
 
+try:  # Use libyaml's C parser when PyYAML was built with it.
+    from yaml import CLoader as YamlLoader
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import Loader as YamlLoader
+    from yaml import SafeLoader as YamlSafeLoader
+
 logger = logging.getLogger(__name__)
 
 # Global configuration instance
 _iconfig: dict[str, Any] = {}
 
+# Parsed configuration files: {absolute path: ((st_mtime_ns, st_size), config)}
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 def load_config(config_path: Optional[Path] = None) -> dict[str, Any]:
     """
@@ -40,15 +52,20 @@ def load_config(config_path: Optional[Path] = None) -> dict[str, Any]:
     if config_path is None:
         raise ValueError("config_path must be provided")
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found at {config_path}")
-
     try:
-        with open(config_path, "rb") as f:
-            if config_path.suffix.lower() == ".yml":
-                config = yaml.safe_load(f)
-            elif config_path.suffix.lower() == ".toml":
-                config = tomli.load(f)
+        st = config_path.stat()  # Raises FileNotFoundError if missing.
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = os.path.abspath(config_path)  # No lstat() per component.
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            config = cached[1]  # Unchanged since last parsed.
+        else:
+            suffix = config_path.suffix.lower()
+            buf = config_path.read_bytes()  # Small file: one read().
+            if suffix == ".yml":
+                config = yaml.load(buf, Loader=YamlSafeLoader)
+            elif suffix == ".toml":
+                config = tomllib.loads(buf.decode())
             else:
                 raise ValueError(
                     f"Unsupported configuration file format: {config_path.suffix}. "
@@ -61,14 +78,16 @@ def load_config(config_path: Optional[Path] = None) -> dict[str, Any]:
                     config_path,
                 )
                 config = {}
+            _PARSE_CACHE[key] = (stamp, config)
 
-            _iconfig.update(config)
+        # Callers may modify the configuration; keep the cached copy pristine.
+        _iconfig.update(copy.deepcopy(config))
 
-            _iconfig["ICONFIG_PATH"] = str(config_path)
-            _iconfig["INSTRUMENT_PATH"] = str(config_path.parent)
-            _iconfig["INSTRUMENT_FOLDER"] = str(config_path.parent.name)
+        _iconfig["ICONFIG_PATH"] = str(config_path)
+        _iconfig["INSTRUMENT_PATH"] = str(config_path.parent)
+        _iconfig["INSTRUMENT_FOLDER"] = str(config_path.parent.name)
 
-            return _iconfig
+        return _iconfig
     except FileNotFoundError:
         logger.error("Configuration file not found: %s", config_path)
         raise
@@ -80,7 +99,7 @@ def load_config(config_path: Optional[Path] = None) -> dict[str, Any]:
             "YAML parsing error in configuration file %s: %s", config_path, str(e)
         )
         raise
-    except tomli.TOMLDecodeError as e:
+    except tomllib.TOMLDecodeError as e:
         logger.error(
             "TOML parsing error in configuration file %s: %s", config_path, str(e)
         )
@@ -150,7 +169,7 @@ def load_config_yaml(config_obj) -> dict:
             logger.warning("YAML configuration is empty")
             return {}
 
-        iconfig = yaml.load(content, yaml.Loader)
+        iconfig = yaml.load(content, Loader=YamlLoader)
         return iconfig if iconfig is not None else {}
     except FileNotFoundError:
         logger.error("YAML configuration file not found: %s", config_obj)
@@ -201,18 +220,24 @@ def validate_instrument_path(
     if expected_dirs is None:
         expected_dirs = ["src", "tests"]
 
-    # Check if the path exists and is a directory
-    if not instrument_path.exists():
+    # Read the directory once instead of a stat() per expected name.
+    try:
+        with os.scandir(instrument_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
         return False, f"Instrument path does not exist: {instrument_path}"
-
-    if not instrument_path.is_dir():
+    except NotADirectoryError:
         return False, f"Instrument path is not a directory: {instrument_path}"
+    except OSError as exc:
+        return False, f"Cannot read instrument path {instrument_path}: {exc}"
 
-    # Check for expected files
-    missing_files = []
-    for file in expected_files:
-        if not (instrument_path / file).exists():
-            missing_files.append(file)
+    # Check for expected files.  A name not listed (a nested path, or a
+    # case-insensitive match) is looked up directly.
+    missing_files = [
+        file
+        for file in expected_files
+        if file not in entries and not (instrument_path / file).exists()
+    ]
 
     if missing_files:
         return (
@@ -221,13 +246,15 @@ def validate_instrument_path(
         )
 
     # Check for expected directories
-    missing_dirs = []
-    for directory in expected_dirs:
-        if (
-            not (instrument_path / directory).exists()
-            or not (instrument_path / directory).is_dir()
-        ):
-            missing_dirs.append(directory)
+    missing_dirs = [
+        directory
+        for directory in expected_dirs
+        if not (
+            entries[directory].is_dir()
+            if directory in entries
+            else (instrument_path / directory).is_dir()
+        )
+    ]
 
     if missing_dirs:
         return (
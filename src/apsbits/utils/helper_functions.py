@@ -11,7 +11,9 @@ Generic utility helper functions
 """
 
 import collections.abc
+import functools
 import logging
+from importlib import import_module
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -34,10 +36,14 @@ def register_bluesky_magics() -> None:
         logger.warning("Could not register Bluesky IPython magics: %s", e)
 
 
+@functools.lru_cache(maxsize=1)
 def running_in_queueserver() -> bool:
     """
     Check if we are running in a Bluesky queueserver.
 
+    The answer cannot change during the life of the process, so it is
+    computed once and remembered.
+
     Returns:
         True if running in a queueserver, False otherwise.
     """
@@ -124,6 +130,7 @@ def mpl_setup() -> None:
                 mpl.use("Agg")
 
 
+@functools.lru_cache(maxsize=None)
 def dynamic_import(full_path: str) -> collections.abc.Callable:
     """
     Import the object given its import path as text.
@@ -131,6 +138,9 @@ def dynamic_import(full_path: str) -> collections.abc.Callable:
     Motivated by specification of class names for plugins
     when using ``apstools.devices.ad_creator()``.
 
+    Successful imports are remembered, so repeated lookups of the same
+    path (one per device in a device file) cost only a dict lookup.
+
     EXAMPLES::
 
         obj = dynamic_import("ophyd.EpicsMotor")
@@ -139,8 +149,6 @@ def dynamic_import(full_path: str) -> collections.abc.Callable:
         IocStats = dynamic_import("instrument.devices.ioc_stats.IocInfoDevice")
         gp_stats = IocStats("gp:", name="gp_stats")
     """
-    from importlib import import_module
-
     import_object = None
 
     if "." not in full_path:
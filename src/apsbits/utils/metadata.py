@@ -74,7 +74,7 @@ def get_md_path(iconfig: collections.abc.Mapping[str, Any] | None = None) -> str
     """
     if iconfig is None:
         return None
-    RE_CONFIG = iconfig.get("RUN_ENGINE", {})
+    RE_CONFIG = iconfig.get("RUN_ENGINE") or {}  # empty section loads as None
     md_path_name = RE_CONFIG.get("MD_PATH", DEFAULT_MD_PATH)
     path = pathlib.Path(md_path_name)
     logger.info("RunEngine metadata saved to: %s", str(path))
@@ -90,8 +90,8 @@ def re_metadata(iconfig: collections.abc.Mapping[str, Any] = {}) -> dict[str, An
         "iconfig": iconfig,
     }
 
-    RE_CONFIG = iconfig.get("RUN_ENGINE", {})
-    md.update(RE_CONFIG.get("DEFAULT_METADATA", {}))
+    RE_CONFIG = iconfig.get("RUN_ENGINE") or {}
+    md.update(RE_CONFIG.get("DEFAULT_METADATA") or {})
 
     conda_prefix = os.environ.get("CONDA_PREFIX")
     if conda_prefix is not None:
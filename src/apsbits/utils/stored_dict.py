@@ -29,6 +29,16 @@ import yaml
 logger = logging.getLogger(__name__)
 
 
+def _building_the_documentation() -> bool:
+    """Is the outermost frame from sphinx-build?  (Walks frames, no source I/O.)"""
+    frame = inspect.currentframe()
+    if frame is None:  # Python implementation without frame support.
+        return False
+    while frame.f_back is not None:
+        frame = frame.f_back
+    return "sphinx-build" in frame.f_code.co_filename
+
+
 class StoredDict(collections.abc.MutableMapping):
     """
     Dictionary that synchronizes its contents to a YAML storage file.
@@ -113,8 +123,7 @@ class StoredDict(collections.abc.MutableMapping):
 
     def __setitem__(self, key, value):
         """Write to the dictionary."""
-        outermost_frame = inspect.getouterframes(inspect.currentframe())[-1]
-        if "sphinx-build" in outermost_frame.filename:
+        if _building_the_documentation():
             # Seems that Sphinx is building the documentation.
             # Ignore all the objects it tries to add.
             return